@@ -1,37 +1,79 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 
-from httpx import AsyncClient
-
-from spark_on_k8s.k8s.async_client import KubernetesAsyncClientManager
-from spark_on_k8s.utils.configuration import Configuration
-
+# the kubernetes and httpx imports are deferred to the singletons' first use, so importing
+# the package (e.g. from the CLI for --help) doesn't pay their import cost
 if TYPE_CHECKING:
+    from httpx import AsyncClient
     from kubernetes_asyncio.client import ApiClient
 
+    from spark_on_k8s.api.informer import SparkAppsInformer
+    from spark_on_k8s.k8s.async_client import KubernetesAsyncClientManager
+
 logger = logging.getLogger("spark_on_k8s.api")
 
 
 class KubernetesClientSingleton:
     """Kubernetes client singleton."""
 
-    client_manager: KubernetesAsyncClientManager = KubernetesAsyncClientManager(
-        config_file=Configuration.SPARK_ON_K8S_CONFIG_FILE,
-        context=Configuration.SPARK_ON_K8S_CONTEXT,
-        client_configuration=Configuration.SPARK_ON_K8S_ASYNC_CLIENT_CONFIG,
-        in_cluster=Configuration.SPARK_ON_K8S_IN_CLUSTER,
-    )
+    _client_manager: KubernetesAsyncClientManager | None = None
     _client: ApiClient | None = None
+    _lock: asyncio.Lock | None = None
+
+    @classmethod
+    def client_manager(cls) -> KubernetesAsyncClientManager:
+        if cls._client_manager is None:
+            from spark_on_k8s.k8s.async_client import KubernetesAsyncClientManager
+            from spark_on_k8s.utils.configuration import Configuration
+
+            cls._client_manager = KubernetesAsyncClientManager(
+                config_file=Configuration.SPARK_ON_K8S_CONFIG_FILE,
+                context=Configuration.SPARK_ON_K8S_CONTEXT,
+                client_configuration=Configuration.SPARK_ON_K8S_ASYNC_CLIENT_CONFIG,
+                in_cluster=Configuration.SPARK_ON_K8S_IN_CLUSTER,
+            )
+        return cls._client_manager
 
     @classmethod
     async def client(cls) -> ApiClient:
-        if not cls._client:
-            cls._client = await cls.client_manager.create_client()
+        if cls._client is None:
+            # the lock is created lazily to avoid binding it to an event loop at import time
+            if cls._lock is None:
+                cls._lock = asyncio.Lock()
+            async with cls._lock:
+                if cls._client is None:
+                    cls._client = await cls.client_manager().create_client()
         return cls._client
 
 
+class SparkAppsInformerSingleton:
+    """Spark apps informer singleton."""
+
+    _informer: SparkAppsInformer | None = None
+
+    @classmethod
+    async def informer(cls) -> SparkAppsInformer:
+        if cls._informer is None:
+            from spark_on_k8s.api.configuration import APIConfiguration
+            from spark_on_k8s.api.informer import SparkAppsInformer
+
+            cls._informer = SparkAppsInformer(
+                client=await KubernetesClientSingleton.client(),
+                namespaces=APIConfiguration.SPARK_ON_K8S_API_WATCH_NAMESPACES,
+            )
+            cls._informer.start()
+        return cls._informer
+
+    @classmethod
+    async def stop(cls) -> None:
+        if cls._informer is not None:
+            await cls._informer.stop()
+            cls._informer = None
+
+
 class AsyncHttpClientSingleton:
     """Async HTTP client singleton."""
 
@@ -40,5 +82,7 @@ class AsyncHttpClientSingleton:
     @classmethod
     def client(cls) -> AsyncClient:
         if not cls._client:
+            from httpx import AsyncClient
+
             cls._client = AsyncClient()
         return cls._client
@@ -22,7 +22,7 @@ async def kill_app(namespace: str, app_id: str):
     It sends a SIGTERM to the init process of the driver pod (PID 1).
     """
     async_spark_app_manager = AsyncSparkAppManager(
-        k8s_client_manager=KubernetesClientSingleton.client_manager
+        k8s_client_manager=KubernetesClientSingleton.client_manager()
     )
     try:
         await async_spark_app_manager.kill_app(namespace=namespace, app_id=app_id)
@@ -43,7 +43,7 @@ async def delete_app(namespace: str, app_id: str, force: bool = False):
     will delete the executor pods and the other resources.
     """
     async_spark_app_manager = AsyncSparkAppManager(
-        k8s_client_manager=KubernetesClientSingleton.client_manager
+        k8s_client_manager=KubernetesClientSingleton.client_manager()
     )
     try:
         await async_spark_app_manager.delete_app(namespace=namespace, app_id=app_id)
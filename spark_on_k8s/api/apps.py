@@ -1,10 +1,25 @@
 from __future__ import annotations
 
+import time
+from typing import TYPE_CHECKING
+
+import msgspec
 from fastapi import APIRouter
-from kubernetes_asyncio.client import CoreV1Api
-from pydantic import BaseModel
+from fastapi.responses import Response, StreamingResponse
+from kubernetes_asyncio.client import ApiException, CoreV1Api
+
+try:
+    # use orjson to parse the LIST payloads when it is available, it's a lot faster
+    import orjson as json
+except ImportError:
+    import json
+
+if TYPE_CHECKING:
+    from typing import AsyncIterator
+
+    from kubernetes_asyncio.client import V1Pod
 
-from spark_on_k8s.api import KubernetesClientSingleton
+from spark_on_k8s.api import KubernetesClientSingleton, SparkAppsInformerSingleton
 from spark_on_k8s.api.configuration import APIConfiguration
 from spark_on_k8s.utils.app_manager import SparkAppStatus, get_app_status
 
@@ -14,7 +29,7 @@ router = APIRouter(
 )
 
 
-class SparkApp(BaseModel):
+class SparkApp(msgspec.Struct, frozen=True):
     """App status."""
 
     app_id: str
@@ -24,25 +39,202 @@ class SparkApp(BaseModel):
     spark_history_proxy: bool = False
 
 
+# raw LIST items per namespace, kept for SPARK_ON_K8S_API_LIST_APPS_CACHE_TTL seconds
+_list_cache: dict[str, tuple[float, list[dict]]] = {}
+# raw cluster-wide LIST items grouped by namespace, with the same TTL
+_all_namespaces_cache: tuple[float, dict[str, list[dict]]] | None = None
+# SparkApp objects keyed by (pod uid, resourceVersion), so unchanged pods between
+# LISTs don't re-run the status parsing and the model validation
+_app_cache: dict[tuple[str, str], SparkApp] = {}
+_APP_CACHE_MAX_SIZE = 1024
+# number of pods fetched per LIST chunk when streaming the apps of a namespace
+_STREAM_APPS_CHUNK_SIZE = 500
+
+
+def _cache_app(key: tuple[str, str], app: SparkApp) -> SparkApp:
+    if len(_app_cache) >= _APP_CACHE_MAX_SIZE:
+        _app_cache.clear()
+    _app_cache[key] = app
+    return app
+
+
+async def _read_list_response(response) -> dict:
+    """Read and parse a raw LIST response, raising ApiException for error statuses.
+
+    With `_preload_content=False` the async client doesn't raise for non-2xx responses,
+    it hands back the raw response, and the error `Status` object would parse as an
+    empty pod list.
+    """
+    body = await response.read()
+    if not 200 <= response.status < 300:
+        exception = ApiException(status=response.status, reason=response.reason)
+        exception.body = body
+        raise exception
+    return json.loads(body)
+
+
+async def _list_driver_pods(namespace: str) -> list[dict]:
+    """List the driver pods of a namespace, caching the result for a short TTL.
+
+    The response is kept as raw JSON and only the few fields needed to build the
+    SparkApp objects are read, skipping the openapi model deserialization of the
+    full pod objects.
+    """
+    ttl = APIConfiguration.SPARK_ON_K8S_API_LIST_APPS_CACHE_TTL
+    now = time.monotonic()
+    if ttl > 0:
+        cached = _list_cache.get(namespace)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+    core_client = CoreV1Api(await KubernetesClientSingleton.client())
+    response = await core_client.list_namespaced_pod(
+        namespace=namespace, label_selector="spark-role=driver", _preload_content=False
+    )
+    driver_pods = (await _read_list_response(response)).get("items", [])
+    if ttl > 0:
+        _list_cache[namespace] = (now, driver_pods)
+    return driver_pods
+
+
+def _pod_to_spark_app(pod: V1Pod) -> SparkApp:
+    """Build a SparkApp from a driver pod, memoized on the pod uid and resourceVersion."""
+    key = (pod.metadata.uid, pod.metadata.resource_version)
+    app = _app_cache.get(key)
+    if app is None:
+        app = _cache_app(
+            key,
+            SparkApp(
+                app_id=pod.metadata.labels.get("spark-app-id", pod.metadata.name),
+                status=get_app_status(pod),
+                driver_logs=True,
+                spark_ui_proxy=pod.metadata.labels.get("spark-ui-proxy") == "true",
+            ),
+        )
+    return app
+
+
+def _raw_pod_to_spark_app(item: dict) -> SparkApp:
+    """Build a SparkApp from a raw LIST item, memoized on the pod uid and resourceVersion."""
+    metadata = item["metadata"]
+    key = (metadata["uid"], metadata["resourceVersion"])
+    app = _app_cache.get(key)
+    if app is None:
+        labels = metadata.get("labels") or {}
+        try:
+            status = SparkAppStatus((item.get("status") or {}).get("phase"))
+        except ValueError:
+            status = SparkAppStatus.Unknown
+        app = _cache_app(
+            key,
+            SparkApp(
+                app_id=labels.get("spark-app-id", metadata["name"]),
+                status=status,
+                driver_logs=True,
+                spark_ui_proxy=labels.get("spark-ui-proxy") == "true",
+            ),
+        )
+    return app
+
+
+async def _list_all_driver_pods() -> dict[str, list[dict]]:
+    """List the driver pods of all namespaces with a single cluster-wide LIST.
+
+    The result is grouped by namespace and also refreshes the per-namespace cache, so
+    following calls to `/list_apps/{namespace}` are served from it.
+    """
+    global _all_namespaces_cache
+    ttl = APIConfiguration.SPARK_ON_K8S_API_LIST_APPS_CACHE_TTL
+    now = time.monotonic()
+    if ttl > 0 and _all_namespaces_cache is not None and now - _all_namespaces_cache[0] < ttl:
+        return _all_namespaces_cache[1]
+    core_client = CoreV1Api(await KubernetesClientSingleton.client())
+    response = await core_client.list_pod_for_all_namespaces(
+        label_selector="spark-role=driver", _preload_content=False
+    )
+    grouped: dict[str, list[dict]] = {}
+    for item in (await _read_list_response(response)).get("items", []):
+        grouped.setdefault(item["metadata"]["namespace"], []).append(item)
+    if ttl > 0:
+        _all_namespaces_cache = (now, grouped)
+        for namespace, namespace_items in grouped.items():
+            _list_cache[namespace] = (now, namespace_items)
+    return grouped
+
+
+def _json_response(content: dict[str, list[SparkApp]] | list[SparkApp]) -> Response:
+    """Encode the SparkApp objects with msgspec in a raw response.
+
+    This skips both the pydantic serialization and FastAPI's jsonable_encoder pass,
+    which dominate the response time when a namespace has many apps.
+    """
+    return Response(content=msgspec.json.encode(content), media_type="application/json")
+
+
+@router.get("/list_all_apps")
+async def list_all_apps() -> Response:
+    """List spark apps in all namespaces, grouped by namespace."""
+    return _json_response(
+        {
+            namespace: [_raw_pod_to_spark_app(item) for item in namespace_items]
+            for namespace, namespace_items in (await _list_all_driver_pods()).items()
+        }
+    )
+
+
 @router.get("/list_apps")
-async def list_apps_default_namespace() -> list[SparkApp]:
+async def list_apps_default_namespace() -> Response:
     """List spark apps in the default namespace."""
-    return await list_apps(namespace=APIConfiguration.SPARK_ON_K8S_API_DEFAULT_NAMESPACE)
+    return _json_response(await list_apps(namespace=APIConfiguration.SPARK_ON_K8S_API_DEFAULT_NAMESPACE))
 
 
-@router.get("/list_apps/{namespace}")
-async def list_apps(namespace: str) -> list[SparkApp]:
-    """List spark apps in a namespace."""
+async def _stream_driver_pods(namespace: str) -> AsyncIterator[bytes]:
+    """Yield the spark apps of a namespace as NDJSON lines, one app per line.
+
+    The driver pods are fetched in chunks of `_STREAM_APPS_CHUNK_SIZE` with the LIST
+    `limit`/`continue` pagination, so only one chunk is held in memory at a time
+    instead of the whole namespace.
+    """
     core_client = CoreV1Api(await KubernetesClientSingleton.client())
-    driver_pods = await core_client.list_namespaced_pod(
-        namespace=namespace, label_selector="spark-role=driver"
-    )
-    return [
-        SparkApp(
-            app_id=pod.metadata.labels.get("spark-app-id", pod.metadata.name),
-            status=get_app_status(pod),
-            driver_logs=True,
-            spark_ui_proxy=pod.metadata.labels.get("spark-ui-proxy", False),
+    continue_token = None
+    while True:
+        response = await core_client.list_namespaced_pod(
+            namespace=namespace,
+            label_selector="spark-role=driver",
+            limit=_STREAM_APPS_CHUNK_SIZE,
+            _continue=continue_token,
+            _preload_content=False,
         )
-        for pod in driver_pods.items
-    ]
+        pod_list = await _read_list_response(response)
+        for item in pod_list.get("items", []):
+            yield msgspec.json.encode(_raw_pod_to_spark_app(item)) + b"\n"
+        continue_token = (pod_list.get("metadata") or {}).get("continue")
+        if not continue_token:
+            return
+
+
+@router.get("/stream_apps/{namespace}")
+async def stream_apps(namespace: str) -> StreamingResponse:
+    """Stream spark apps in a namespace as NDJSON.
+
+    Unlike `/list_apps/{namespace}`, the response is produced incrementally and is never
+    cached, which keeps the memory footprint constant on very large namespaces.
+    """
+    return StreamingResponse(_stream_driver_pods(namespace), media_type="application/x-ndjson")
+
+
+async def list_apps(namespace: str) -> list[SparkApp]:
+    """List spark apps in a namespace."""
+    if namespace in APIConfiguration.SPARK_ON_K8S_API_WATCH_NAMESPACES:
+        # the namespace is watched, serve the list from the informer cache instead of
+        # hitting the API server
+        informer = await SparkAppsInformerSingleton.informer()
+        driver_pods = informer.namespace_pods(namespace)
+        return [_pod_to_spark_app(pod) for pod in driver_pods]
+    driver_pods = await _list_driver_pods(namespace)
+    return [_raw_pod_to_spark_app(item) for item in driver_pods]
+
+
+@router.get("/list_apps/{namespace}")
+async def list_namespace_apps(namespace: str) -> Response:
+    """List spark apps in a namespace."""
+    return _json_response(await list_apps(namespace))
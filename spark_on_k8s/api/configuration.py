@@ -14,3 +14,9 @@ class APIConfiguration:
     SPARK_ON_K8S_API_LOG_LEVEL = getenv("SPARK_ON_K8S_API_LOG_LEVEL", "info")
     SPARK_ON_K8S_API_LIMIT_CONCURRENCY = int(getenv("SPARK_ON_K8S_API_LIMIT_CONCURRENCY", "1000"))
     SPARK_ON_K8S_API_SPARK_HISTORY_HOST = getenv("SPARK_ON_K8S_API_SPARK_HISTORY_HOST", None)
+    SPARK_ON_K8S_API_LIST_APPS_CACHE_TTL = int(getenv("SPARK_ON_K8S_API_LIST_APPS_CACHE_TTL", "10"))
+    SPARK_ON_K8S_API_WATCH_NAMESPACES = (
+        getenv("SPARK_ON_K8S_API_WATCH_NAMESPACES").split(",")
+        if getenv("SPARK_ON_K8S_API_WATCH_NAMESPACES")
+        else []
+    )
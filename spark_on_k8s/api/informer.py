@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from kubernetes_asyncio import watch
+from kubernetes_asyncio.client import ApiException, CoreV1Api
+
+if TYPE_CHECKING:
+    from kubernetes_asyncio.client import ApiClient, V1Pod
+
+logger = logging.getLogger("spark_on_k8s.api")
+
+
+class SparkAppsInformer:
+    """In-memory cache of Spark driver pods maintained by Kubernetes watch streams.
+
+    For each watched namespace, a background task lists the driver pods once, then keeps
+    the cache in sync from watch events instead of re-listing on every request.
+
+    Args:
+        client (ApiClient): Kubernetes async client.
+        namespaces (list[str]): Namespaces to watch.
+    """
+
+    def __init__(self, *, client: ApiClient, namespaces: list[str]) -> None:
+        self.core_client = CoreV1Api(client)
+        self.namespaces = namespaces
+        self.cache: dict[str, dict[str, V1Pod]] = {namespace: {} for namespace in namespaces}
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        """Start a watch task per watched namespace."""
+        self._tasks = [asyncio.create_task(self._watch_namespace(namespace)) for namespace in self.namespaces]
+
+    async def stop(self) -> None:
+        """Cancel the watch tasks and wait for them to finish."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _watch_namespace(self, namespace: str) -> None:
+        """Keep the cache of a namespace in sync with the cluster.
+
+        The namespace is re-listed on startup and whenever the watch resourceVersion
+        expires (410 Gone), then the cache is updated from watch events.
+
+        Args:
+            namespace (str): Namespace to watch.
+        """
+        while True:
+            try:
+                resource_version = await self._list_namespace(namespace)
+                async with watch.Watch() as watcher:
+                    async for event in watcher.stream(
+                        self.core_client.list_namespaced_pod,
+                        namespace=namespace,
+                        label_selector="spark-role=driver",
+                        resource_version=resource_version,
+                        timeout_seconds=300,
+                    ):
+                        self._handle_event(namespace, event)
+            except asyncio.CancelledError:
+                raise
+            except ApiException as e:
+                if e.status == 410:
+                    # the resourceVersion expired, re-list and resume from the new one
+                    continue
+                logger.exception(f"Watching namespace {namespace} failed, retrying in 5 seconds")
+                await asyncio.sleep(5)
+            except Exception:
+                logger.exception(f"Watching namespace {namespace} failed, retrying in 5 seconds")
+                await asyncio.sleep(5)
+
+    async def _list_namespace(self, namespace: str) -> str:
+        """Replace the cache of a namespace with a fresh LIST result.
+
+        Args:
+            namespace (str): Namespace to list.
+
+        Returns:
+            str: resourceVersion to resume the watch from.
+        """
+        pod_list = await self.core_client.list_namespaced_pod(
+            namespace=namespace,
+            label_selector="spark-role=driver",
+        )
+        self.cache[namespace] = {pod.metadata.name: pod for pod in pod_list.items}
+        return pod_list.metadata.resource_version
+
+    def _handle_event(self, namespace: str, event: dict) -> None:
+        pod = event["object"]
+        if event["type"] == "DELETED":
+            self.cache[namespace].pop(pod.metadata.name, None)
+        else:
+            self.cache[namespace][pod.metadata.name] = pod
+
+    def namespace_pods(self, namespace: str) -> list[V1Pod]:
+        """Get the cached driver pods of a namespace.
+
+        Args:
+            namespace (str): Namespace.
+
+        Returns:
+            list[V1Pod]: Cached driver pods in the namespace.
+        """
+        return list(self.cache.get(namespace, {}).values())
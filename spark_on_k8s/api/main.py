@@ -3,21 +3,30 @@ from __future__ import annotations
 from pathlib import Path
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from starlette.staticfiles import StaticFiles
 
 from spark_on_k8s import __version__
-from spark_on_k8s.api import AsyncHttpClientSingleton, KubernetesClientSingleton
+from spark_on_k8s.api import (
+    AsyncHttpClientSingleton,
+    KubernetesClientSingleton,
+    SparkAppsInformerSingleton,
+)
 from spark_on_k8s.api.app import router as app_router
 from spark_on_k8s.api.apps import router as apps_router
+from spark_on_k8s.api.configuration import APIConfiguration
 from spark_on_k8s.api.webserver import router as webserver_router
 
 
 async def on_start_up() -> None:
     await KubernetesClientSingleton.client()
     AsyncHttpClientSingleton.client()
+    if APIConfiguration.SPARK_ON_K8S_API_WATCH_NAMESPACES:
+        await SparkAppsInformerSingleton.informer()
 
 
 async def on_shutdown() -> None:
+    await SparkAppsInformerSingleton.stop()
     await (await KubernetesClientSingleton.client()).close()
     await AsyncHttpClientSingleton.client().aclose()
 
@@ -26,6 +35,7 @@ app = FastAPI(
     title="Spark on Kubernetes",
     description="Spark on Kubernetes API",
     version=__version__,
+    default_response_class=ORJSONResponse,
     on_startup=[on_start_up],
     on_shutdown=[on_shutdown],
 )
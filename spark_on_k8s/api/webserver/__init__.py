@@ -4,6 +4,7 @@ from functools import wraps
 from pathlib import Path
 
 import httpx
+import msgspec
 from fastapi import APIRouter, HTTPException, WebSocket
 from kubernetes_asyncio.client import ApiException
 from starlette.background import BackgroundTask
@@ -144,7 +145,9 @@ async def apps(request: Request):
         if app.app_id not in apps_dict:
             apps_dict[app.app_id] = app
         else:
-            apps_dict[app.app_id].spark_history_proxy = True
+            # SparkApp is frozen (the instances are shared through a cache), so replace
+            # the entry instead of mutating it
+            apps_dict[app.app_id] = msgspec.structs.replace(apps_dict[app.app_id], spark_history_proxy=True)
     return templates.TemplateResponse(
         "apps.html",
         {
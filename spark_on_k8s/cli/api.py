@@ -60,6 +60,15 @@ def start(
     except ImportError:
         raise ImportError("Please install API dependencies with `pip install spark-on-k8s[api]`.") from None
 
+    try:
+        # use the libuv-based event loop when it is available, it handles a lot more
+        # concurrent connections than the default asyncio loop
+        import uvloop  # noqa: F401
+
+        loop = "uvloop"
+    except ImportError:
+        loop = "auto"
+
     uvicorn.run(
         "spark_on_k8s.api.main:app",
         host=host,
@@ -67,4 +76,5 @@ def start(
         log_level=log_level,
         workers=workers,
         limit_concurrency=limit_concurrency,
+        loop=loop,
     )
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 import click
 
+if TYPE_CHECKING:
+    from spark_on_k8s.utils.app_manager import SparkAppManager
+
 from spark_on_k8s.cli.options import (
     app_id_option,
     app_name_option,
@@ -44,6 +47,23 @@ def app_cli():
     pass
 
 
+_app_manager: SparkAppManager | None = None
+
+
+def _get_app_manager() -> SparkAppManager:
+    """Get the shared app manager, creating it on first use.
+
+    All the subcommands share a single `SparkAppManager` instance, so the kube config is loaded
+    only once per CLI invocation instead of once per command.
+    """
+    global _app_manager
+    from spark_on_k8s.utils.app_manager import SparkAppManager
+
+    if _app_manager is None:
+        _app_manager = SparkAppManager()
+    return _app_manager
+
+
 class SparkAppCommand(click.Command):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -56,25 +76,19 @@ class SparkAppCommand(click.Command):
     help="Get the status of a Spark application.",
 )
 def status(app_id: str, namespace: str):
-    from spark_on_k8s.utils.app_manager import SparkAppManager
-
-    app_manager = SparkAppManager()
+    app_manager = _get_app_manager()
     print(app_manager.app_status(namespace=namespace, app_id=app_id).value)
 
 
 @app_cli.command(cls=SparkAppCommand, help="Stream the logs of a Spark application.")
 def logs(app_id: str, namespace: str):
-    from spark_on_k8s.utils.app_manager import SparkAppManager
-
-    app_manager = SparkAppManager()
+    app_manager = _get_app_manager()
     app_manager.stream_logs(namespace=namespace, app_id=app_id, should_print=True)
 
 
 @app_cli.command(cls=SparkAppCommand, help="Kill a Spark application.")
 def kill(app_id: str, namespace: str):
-    from spark_on_k8s.utils.app_manager import SparkAppManager
-
-    app_manager = SparkAppManager()
+    app_manager = _get_app_manager()
     app_manager.kill_app(namespace=namespace, app_id=app_id)
 
 
@@ -84,17 +98,13 @@ def kill(app_id: str, namespace: str):
     help="Delete a Spark application.",
 )
 def delete(app_id: str, namespace: str, force: bool):
-    from spark_on_k8s.utils.app_manager import SparkAppManager
-
-    app_manager = SparkAppManager()
+    app_manager = _get_app_manager()
     app_manager.delete_app(namespace=namespace, app_id=app_id, force=force)
 
 
 @app_cli.command(cls=SparkAppCommand, help="Wait for a Spark application to finish.")
 def wait(app_id: str, namespace: str):
-    from spark_on_k8s.utils.app_manager import SparkAppManager
-
-    app_manager = SparkAppManager()
+    app_manager = _get_app_manager()
     app_manager.wait_for_app(namespace=namespace, app_id=app_id, should_print=True)
     app_status = app_manager.app_status(namespace=namespace, app_id=app_id)
     print(f"App {app_id} has terminated with status {app_status.value}")
@@ -208,3 +218,73 @@ def submit(
         executor_annotations=executor_annotations,
         executor_pod_template_path=executor_pod_template_path,
     )
+
+
+@app_cli.command(
+    name="submit-batch",
+    help="Submit a batch of Spark applications concurrently from a manifest file.",
+)
+@click.argument("manifest", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--max-workers",
+    type=int,
+    default=10,
+    show_default=True,
+    help="Maximum number of concurrent submissions.",
+)
+def submit_batch(manifest: str, max_workers: int):
+    """Submit all the applications described in a JSON or YAML manifest file.
+
+    The manifest contains a list of application specs, each spec holding keyword arguments
+    for `SparkOnK8S.submit_app` (e.g. image, app_path, namespace, ...). The submissions are
+    performed concurrently with the async client, bounded by `--max-workers`.
+    """
+    import asyncio
+    import json
+
+    from spark_on_k8s.client import ExecutorInstances, PodResources, SparkOnK8S
+
+    with open(manifest) as manifest_file:
+        if manifest.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError as e:
+                raise click.UsageError("PyYAML is required to load YAML manifests") from e
+            apps = yaml.safe_load(manifest_file)
+        else:
+            apps = json.load(manifest_file)
+    if not isinstance(apps, list):
+        raise click.UsageError("The manifest must contain a list of application specs")
+    for app_spec in apps:
+        if "should_print" in app_spec:
+            raise click.UsageError(
+                "The manifest must not set should_print, the submit-batch command always prints"
+            )
+        for key, spec_class in (
+            ("driver_resources", PodResources),
+            ("executor_resources", PodResources),
+            ("executor_instances", ExecutorInstances),
+        ):
+            if isinstance(app_spec.get(key), dict):
+                app_spec[key] = spec_class(**app_spec[key])
+    spark_client = SparkOnK8S()
+
+    async def _submit_all() -> list[str | Exception]:
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def _submit_one(spec: dict) -> str:
+            async with semaphore:
+                return await spark_client.submit_app_async(should_print=True, **spec)
+
+        return await asyncio.gather(*[_submit_one(app_spec) for app_spec in apps], return_exceptions=True)
+
+    results = asyncio.run(_submit_all())
+    failures = 0
+    for app_spec, result in zip(apps, results):
+        if isinstance(result, Exception):
+            failures += 1
+            print(f"Failed to submit app {app_spec.get('app_name', '<unnamed>')}: {result}")
+        else:
+            print(f"Submitted app {result}")
+    if failures:
+        raise click.ClickException(f"{failures} of {len(apps)} submissions failed")
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Literal
+from typing import TYPE_CHECKING, Any, Callable, Literal
 
 from kubernetes import client as k8s
 
@@ -15,9 +16,30 @@ from spark_on_k8s.utils.configuration import Configuration
 from spark_on_k8s.utils.logging_mixin import LoggingMixin
 from spark_on_k8s.utils.types import NOTSET, ArgNotSet
 
+if TYPE_CHECKING:
+    from spark_on_k8s.k8s.async_client import KubernetesAsyncClientManager
+
 # For Python 3.8 and 3.9 compatibility
 KW_ONLY_DATACLASS = {"kw_only": True} if "kw_only" in dataclass.__kwdefaults__ else {}
 
+if Configuration.SPARK_ON_K8S_USE_RE2:
+    try:
+        # re2 compiles to a linear-time DFA, which pays off when sanitizing many app
+        # names in bulk submissions
+        import re2 as _re
+    except ImportError:
+        _re = re
+else:
+    _re = re
+
+# Precompiled patterns used by `_parse_app_name_and_id` to sanitize app names against
+# the Kubernetes naming conventions
+_NON_ALPHANUMERIC = _re.compile(r"[^0-9a-zA-Z]+")
+_LEADING_NON_ALPHA = _re.compile(r"^[^a-zA-Z]*")
+_TRAILING_DASHES = _re.compile(r"-*$")
+
+_SPARK_K8S_MASTER = "k8s://https://kubernetes.default.svc.cluster.local:443"
+
 
 def default_app_id_suffix() -> str:
     """Default function to generate a suffix for the application ID
@@ -67,6 +89,29 @@ class ExecutorInstances:
     initial: int | None = None
 
 
+@dataclass(**KW_ONLY_DATACLASS)
+class _AppSubmission:
+    """Prepared Kubernetes resources and resolved options for an app submission
+
+    Attributes:
+        app_name: Name of the Spark application
+        app_id: ID of the Spark application
+        namespace: Kubernetes namespace to submit the application to
+        pod: Driver pod template spec
+        secret: Secret holding the application secret values, or None if there are none
+        extra_labels: Labels to add to the headless service
+        app_waiter: How to wait for the app to finish
+    """
+
+    app_name: str
+    app_id: str
+    namespace: str
+    pod: k8s.V1PodTemplateSpec
+    secret: k8s.V1Secret | None
+    extra_labels: dict[str, str]
+    app_waiter: str
+
+
 class SparkOnK8S(LoggingMixin):
     """Client for submitting Spark apps to Kubernetes
 
@@ -86,6 +131,8 @@ class SparkOnK8S(LoggingMixin):
 
     Args:
         k8s_client_manager: Kubernetes client manager to use for creating Kubernetes clients
+        k8s_async_client_manager: Kubernetes async client manager to use for the async submissions,
+            created lazily on the first async submission if not provided
         logger_name: Name of the logger to use for logging, defaults to "SparkOnK8S"
     """
 
@@ -93,11 +140,15 @@ class SparkOnK8S(LoggingMixin):
         self,
         *,
         k8s_client_manager: KubernetesClientManager | None = None,
+        k8s_async_client_manager: KubernetesAsyncClientManager | None = None,
         logger_name: str | None = None,
     ):
         super().__init__(logger_name=logger_name or "SparkOnK8S")
         self.k8s_client_manager = k8s_client_manager or KubernetesClientManager()
+        self.k8s_async_client_manager = k8s_async_client_manager
         self.app_manager = SparkAppManager(k8s_client_manager=self.k8s_client_manager)
+        # static prefix of the driver command, shared by all the submissions of this client
+        self._static_driver_args = ["driver", "--master", _SPARK_K8S_MASTER]
 
     def submit_app(
         self,
@@ -174,6 +225,255 @@ class SparkOnK8S(LoggingMixin):
         Returns:
             Name of the Spark application pod
         """
+        submission = self._prepare_app_submission(
+            image=image,
+            app_path=app_path,
+            namespace=namespace,
+            service_account=service_account,
+            app_name=app_name,
+            spark_conf=spark_conf,
+            class_name=class_name,
+            app_arguments=app_arguments,
+            app_id_suffix=app_id_suffix,
+            app_waiter=app_waiter,
+            image_pull_policy=image_pull_policy,
+            ui_reverse_proxy=ui_reverse_proxy,
+            driver_resources=driver_resources,
+            executor_resources=executor_resources,
+            executor_instances=executor_instances,
+            should_print=should_print,
+            secret_values=secret_values,
+            driver_env_vars_from_secrets=driver_env_vars_from_secrets,
+            volumes=volumes,
+            driver_volume_mounts=driver_volume_mounts,
+            executor_volume_mounts=executor_volume_mounts,
+            driver_node_selector=driver_node_selector,
+            executor_node_selector=executor_node_selector,
+            driver_annotations=driver_annotations,
+            executor_annotations=executor_annotations,
+            driver_labels=driver_labels,
+            executor_labels=executor_labels,
+            driver_tolerations=driver_tolerations,
+            executor_pod_template_path=executor_pod_template_path,
+        )
+        with self.k8s_client_manager.client() as client:
+            api = k8s.CoreV1Api(client)
+            if submission.secret:
+                api.create_namespaced_secret(namespace=submission.namespace, body=submission.secret)
+            pod = api.create_namespaced_pod(
+                namespace=submission.namespace,
+                body=submission.pod,
+            )
+            if submission.secret:
+                submission.secret.metadata.owner_references = [
+                    k8s.V1OwnerReference(
+                        api_version="v1",
+                        kind="Pod",
+                        name=pod.metadata.name,
+                        uid=pod.metadata.uid,
+                    )
+                ]
+                api.patch_namespaced_secret(
+                    namespace=submission.namespace,
+                    name=submission.secret.metadata.name,
+                    body=submission.secret,
+                )
+            api.create_namespaced_service(
+                namespace=submission.namespace,
+                body=SparkAppManager.create_headless_service_object(
+                    app_name=submission.app_name,
+                    app_id=submission.app_id,
+                    namespace=submission.namespace,
+                    pod_owner_uid=pod.metadata.uid,
+                    extra_labels=submission.extra_labels,
+                ),
+            )
+        if submission.app_waiter == SparkAppWait.LOG:
+            self.app_manager.stream_logs(
+                namespace=submission.namespace,
+                pod_name=pod.metadata.name,
+                should_print=should_print,
+            )
+        elif submission.app_waiter == SparkAppWait.WAIT:
+            self.app_manager.wait_for_app(
+                namespace=submission.namespace, pod_name=pod.metadata.name, should_print=should_print
+            )
+        return pod.metadata.name
+
+    async def submit_app_async(
+        self,
+        *,
+        image: str | ArgNotSet = NOTSET,
+        app_path: str | ArgNotSet = NOTSET,
+        namespace: str | ArgNotSet = NOTSET,
+        service_account: str | ArgNotSet = NOTSET,
+        app_name: str | ArgNotSet = NOTSET,
+        spark_conf: dict[str, str] | ArgNotSet = NOTSET,
+        class_name: str | ArgNotSet = NOTSET,
+        app_arguments: list[str] | ArgNotSet = NOTSET,
+        app_id_suffix: Callable[[], str] | ArgNotSet = NOTSET,
+        app_waiter: Literal["no_wait", "wait", "log"] | ArgNotSet = NOTSET,
+        image_pull_policy: Literal["Always", "Never", "IfNotPresent"] | ArgNotSet = NOTSET,
+        ui_reverse_proxy: bool | ArgNotSet = NOTSET,
+        driver_resources: PodResources | ArgNotSet = NOTSET,
+        executor_resources: PodResources | ArgNotSet = NOTSET,
+        executor_instances: ExecutorInstances | ArgNotSet = NOTSET,
+        should_print: bool | ArgNotSet = NOTSET,
+        secret_values: dict[str, str] | ArgNotSet = NOTSET,
+        driver_env_vars_from_secrets: list[str] | ArgNotSet = NOTSET,
+        volumes: list[k8s.V1Volume] | ArgNotSet = NOTSET,
+        driver_volume_mounts: list[k8s.V1VolumeMount] | ArgNotSet = NOTSET,
+        executor_volume_mounts: list[k8s.V1VolumeMount] | ArgNotSet = NOTSET,
+        driver_node_selector: dict[str, str] | ArgNotSet = NOTSET,
+        executor_node_selector: dict[str, str] | ArgNotSet = NOTSET,
+        driver_annotations: dict[str, str] | ArgNotSet = NOTSET,
+        executor_annotations: dict[str, str] | ArgNotSet = NOTSET,
+        driver_labels: dict[str, str] | ArgNotSet = NOTSET,
+        executor_labels: dict[str, str] | ArgNotSet = NOTSET,
+        driver_tolerations: list[k8s.V1Toleration] | ArgNotSet = NOTSET,
+        executor_pod_template_path: str | ArgNotSet = NOTSET,
+    ) -> str:
+        """Submit a Spark app to Kubernetes asynchronously
+
+        It accepts the same arguments as `submit_app`, but issues the Kubernetes calls with
+        the async client, so multiple submissions can run concurrently (e.g. gathered with
+        `asyncio.gather` under a semaphore).
+
+        Returns:
+            Name of the Spark application pod
+        """
+        from kubernetes_asyncio import client as k8s_async
+
+        from spark_on_k8s.k8s.async_client import KubernetesAsyncClientManager
+        from spark_on_k8s.utils.async_app_manager import AsyncSparkAppManager
+
+        submission = self._prepare_app_submission(
+            image=image,
+            app_path=app_path,
+            namespace=namespace,
+            service_account=service_account,
+            app_name=app_name,
+            spark_conf=spark_conf,
+            class_name=class_name,
+            app_arguments=app_arguments,
+            app_id_suffix=app_id_suffix,
+            app_waiter=app_waiter,
+            image_pull_policy=image_pull_policy,
+            ui_reverse_proxy=ui_reverse_proxy,
+            driver_resources=driver_resources,
+            executor_resources=executor_resources,
+            executor_instances=executor_instances,
+            should_print=should_print,
+            secret_values=secret_values,
+            driver_env_vars_from_secrets=driver_env_vars_from_secrets,
+            volumes=volumes,
+            driver_volume_mounts=driver_volume_mounts,
+            executor_volume_mounts=executor_volume_mounts,
+            driver_node_selector=driver_node_selector,
+            executor_node_selector=executor_node_selector,
+            driver_annotations=driver_annotations,
+            executor_annotations=executor_annotations,
+            driver_labels=driver_labels,
+            executor_labels=executor_labels,
+            driver_tolerations=driver_tolerations,
+            executor_pod_template_path=executor_pod_template_path,
+        )
+        if self.k8s_async_client_manager is None:
+            self.k8s_async_client_manager = KubernetesAsyncClientManager()
+        async with self.k8s_async_client_manager.client() as client:
+            api = k8s_async.CoreV1Api(client)
+            if submission.secret:
+                await api.create_namespaced_secret(namespace=submission.namespace, body=submission.secret)
+            pod = await api.create_namespaced_pod(
+                namespace=submission.namespace,
+                body=submission.pod,
+            )
+            # the secret owner patch and the service creation both need the created pod
+            # uid but are independent of each other, so they are issued concurrently
+            post_pod_calls = []
+            if submission.secret:
+                submission.secret.metadata.owner_references = [
+                    k8s.V1OwnerReference(
+                        api_version="v1",
+                        kind="Pod",
+                        name=pod.metadata.name,
+                        uid=pod.metadata.uid,
+                    )
+                ]
+                post_pod_calls.append(
+                    api.patch_namespaced_secret(
+                        namespace=submission.namespace,
+                        name=submission.secret.metadata.name,
+                        body=submission.secret,
+                    )
+                )
+            post_pod_calls.append(
+                api.create_namespaced_service(
+                    namespace=submission.namespace,
+                    body=SparkAppManager.create_headless_service_object(
+                        app_name=submission.app_name,
+                        app_id=submission.app_id,
+                        namespace=submission.namespace,
+                        pod_owner_uid=pod.metadata.uid,
+                        extra_labels=submission.extra_labels,
+                    ),
+                )
+            )
+            await asyncio.gather(*post_pod_calls)
+        if submission.app_waiter == SparkAppWait.LOG:
+            async_app_manager = AsyncSparkAppManager(k8s_client_manager=self.k8s_async_client_manager)
+            async for line in async_app_manager.logs_streamer(
+                namespace=submission.namespace, pod_name=pod.metadata.name
+            ):
+                self.log(msg=line, level=logging.INFO, should_print=should_print)
+        elif submission.app_waiter == SparkAppWait.WAIT:
+            async_app_manager = AsyncSparkAppManager(k8s_client_manager=self.k8s_async_client_manager)
+            await async_app_manager.wait_for_app(
+                namespace=submission.namespace, pod_name=pod.metadata.name, should_print=should_print
+            )
+        return pod.metadata.name
+
+    def _prepare_app_submission(
+        self,
+        *,
+        image: str | ArgNotSet = NOTSET,
+        app_path: str | ArgNotSet = NOTSET,
+        namespace: str | ArgNotSet = NOTSET,
+        service_account: str | ArgNotSet = NOTSET,
+        app_name: str | ArgNotSet = NOTSET,
+        spark_conf: dict[str, str] | ArgNotSet = NOTSET,
+        class_name: str | ArgNotSet = NOTSET,
+        app_arguments: list[str] | ArgNotSet = NOTSET,
+        app_id_suffix: Callable[[], str] | ArgNotSet = NOTSET,
+        app_waiter: Literal["no_wait", "wait", "log"] | ArgNotSet = NOTSET,
+        image_pull_policy: Literal["Always", "Never", "IfNotPresent"] | ArgNotSet = NOTSET,
+        ui_reverse_proxy: bool | ArgNotSet = NOTSET,
+        driver_resources: PodResources | ArgNotSet = NOTSET,
+        executor_resources: PodResources | ArgNotSet = NOTSET,
+        executor_instances: ExecutorInstances | ArgNotSet = NOTSET,
+        should_print: bool | ArgNotSet = NOTSET,
+        secret_values: dict[str, str] | ArgNotSet = NOTSET,
+        driver_env_vars_from_secrets: list[str] | ArgNotSet = NOTSET,
+        volumes: list[k8s.V1Volume] | ArgNotSet = NOTSET,
+        driver_volume_mounts: list[k8s.V1VolumeMount] | ArgNotSet = NOTSET,
+        executor_volume_mounts: list[k8s.V1VolumeMount] | ArgNotSet = NOTSET,
+        driver_node_selector: dict[str, str] | ArgNotSet = NOTSET,
+        executor_node_selector: dict[str, str] | ArgNotSet = NOTSET,
+        driver_annotations: dict[str, str] | ArgNotSet = NOTSET,
+        executor_annotations: dict[str, str] | ArgNotSet = NOTSET,
+        driver_labels: dict[str, str] | ArgNotSet = NOTSET,
+        executor_labels: dict[str, str] | ArgNotSet = NOTSET,
+        driver_tolerations: list[k8s.V1Toleration] | ArgNotSet = NOTSET,
+        executor_pod_template_path: str | ArgNotSet = NOTSET,
+    ) -> _AppSubmission:
+        """Resolve the submission arguments and build the Kubernetes resources to create
+
+        It accepts the same arguments as `submit_app` and applies the same defaulting
+        logic, without creating any resource.
+
+        Returns:
+            The prepared app submission
+        """
         if image is NOTSET:
             if Configuration.SPARK_ON_K8S_DOCKER_IMAGE is None:
                 raise ValueError(
@@ -319,12 +619,13 @@ class SparkOnK8S(LoggingMixin):
             basic_conf.update(self._executor_annotations(annotations=executor_annotations))
         if executor_pod_template_path:
             basic_conf.update(self._executor_pod_template_path(executor_pod_template_path))
-        driver_command_args = ["driver", "--master", "k8s://https://kubernetes.default.svc.cluster.local:443"]
-        if class_name:
-            driver_command_args.extend(["--class", class_name])
-        driver_command_args.extend(
-            self._spark_config_to_arguments({**basic_conf, **spark_conf}) + [app_path, *main_class_parameters]
-        )
+        driver_command_args = [
+            *self._static_driver_args,
+            *(["--class", class_name] if class_name else []),
+            *self._spark_config_to_arguments({**basic_conf, **spark_conf}),
+            app_path,
+            *main_class_parameters,
+        ]
         pod = SparkAppManager.create_spark_pod_spec(
             app_name=app_name,
             app_id=app_id,
@@ -350,55 +651,23 @@ class SparkOnK8S(LoggingMixin):
             node_selector=driver_node_selector,
             tolerations=driver_tolerations,
         )
-        with self.k8s_client_manager.client() as client:
-            api = k8s.CoreV1Api(client)
-            if secret_values:
-                application_secret = self.app_manager.create_secret_object(
-                    app_name=app_name,
-                    app_id=app_id,
-                    secrets_values=secret_values,
-                    namespace=namespace,
-                )
-                api.create_namespaced_secret(namespace=namespace, body=application_secret)
-            pod = api.create_namespaced_pod(
+        application_secret = None
+        if secret_values:
+            application_secret = self.app_manager.create_secret_object(
+                app_name=app_name,
+                app_id=app_id,
+                secrets_values=secret_values,
                 namespace=namespace,
-                body=pod,
             )
-            if secret_values:
-                application_secret.metadata.owner_references = [
-                    k8s.V1OwnerReference(
-                        api_version="v1",
-                        kind="Pod",
-                        name=pod.metadata.name,
-                        uid=pod.metadata.uid,
-                    )
-                ]
-                api.patch_namespaced_secret(
-                    namespace=namespace,
-                    name=application_secret.metadata.name,
-                    body=application_secret,
-                )
-            api.create_namespaced_service(
-                namespace=namespace,
-                body=SparkAppManager.create_headless_service_object(
-                    app_name=app_name,
-                    app_id=app_id,
-                    namespace=namespace,
-                    pod_owner_uid=pod.metadata.uid,
-                    extra_labels=extra_labels,
-                ),
-            )
-        if app_waiter == SparkAppWait.LOG:
-            self.app_manager.stream_logs(
-                namespace=namespace,
-                pod_name=pod.metadata.name,
-                should_print=should_print,
-            )
-        elif app_waiter == SparkAppWait.WAIT:
-            self.app_manager.wait_for_app(
-                namespace=namespace, pod_name=pod.metadata.name, should_print=should_print
-            )
-        return pod.metadata.name
+        return _AppSubmission(
+            app_name=app_name,
+            app_id=app_id,
+            namespace=namespace,
+            pod=pod,
+            secret=application_secret,
+            extra_labels=extra_labels,
+            app_waiter=app_waiter,
+        )
 
     def _parse_app_name_and_id(
         self,
@@ -436,12 +705,11 @@ class SparkOnK8S(LoggingMixin):
             if len(app_name) > (63 - len(app_id_suffix_str) + 1):
                 app_name = app_name[: (63 - len(app_id_suffix_str)) + 1]
             # Replace all non-alphanumeric characters with dashes
-            app_name = re.sub(r"[^0-9a-zA-Z]+", "-", app_name)
-            # Remove leading non-alphabetic characters
-            app_name = re.sub(r"^[^a-zA-Z]*", "", app_name)
-            # Remove leading and trailing dashes
-            app_name = re.sub(r"^-*", "", app_name)
-            app_name = re.sub(r"-*$", "", app_name)
+            app_name = _NON_ALPHANUMERIC.sub("-", app_name)
+            # Remove leading non-alphabetic characters (including dashes)
+            app_name = _LEADING_NON_ALPHA.sub("", app_name)
+            # Remove trailing dashes
+            app_name = _TRAILING_DASHES.sub("", app_name)
             app_id = app_name + app_id_suffix_str
             if app_name != original_app_name:
                 self.log(
@@ -472,10 +740,11 @@ class SparkOnK8S(LoggingMixin):
         """
         if not spark_conf:
             return []
-        args = []
-        for key, value in spark_conf.items():
-            args.extend(["--conf", f"{key}={SparkOnK8S._value_to_str(value)}"])
-        return args
+        return [
+            arg
+            for key, value in spark_conf.items()
+            for arg in ("--conf", f"{key}={SparkOnK8S._value_to_str(value)}")
+        ]
 
     @staticmethod
     def _executor_secrets_config(
@@ -78,4 +78,10 @@ class KubernetesAsyncClientManager:
             )
         else:
             config.load_incluster_config()
-        return k8s.ApiClient()
+        client_configuration = self.client_configuration
+        if client_configuration is None:
+            client_configuration = k8s.Configuration.get_default_copy()
+            # size the aiohttp connection pool of the client so concurrent calls reuse
+            # keep-alive connections instead of re-handshaking TLS
+            client_configuration.connection_pool_maxsize = Configuration.SPARK_ON_K8S_CONNECTION_POOL_MAXSIZE
+        return k8s.ApiClient(configuration=client_configuration)
@@ -91,34 +91,128 @@ class AsyncSparkAppManager(LoggingMixin):
             poll_interval (float, optional): Poll interval in seconds. Defaults to 10.
             should_print (bool, optional): Whether to print logs instead of logging them.
         """
-        termination_statuses = {SparkAppStatus.Succeeded, SparkAppStatus.Failed, SparkAppStatus.Unknown}
         async with self.k8s_client_manager.client() as client:
             api = k8s_async.CoreV1Api(client)
-            while True:
-                try:
-                    status = await self.app_status(
-                        namespace=namespace, pod_name=pod_name, app_id=app_id, client=api
-                    )
-                    if status in termination_statuses:
-                        break
-                except ApiException as e:
-                    if e.status == 404:
-                        self.log(
-                            msg=f"Pod {pod_name} was deleted", level=logging.INFO, should_print=should_print
-                        )
-                        return
+            try:
+                status = await self._wait_for_app_with_watch(
+                    api=api, namespace=namespace, pod_name=pod_name, app_id=app_id
+                )
+            except Exception:
                 self.log(
-                    msg=f"Pod {pod_name} status is {status}, sleep {poll_interval}s",
-                    level=logging.INFO,
+                    msg=f"Watching pod {pod_name} failed, falling back to polling",
+                    level=logging.WARNING,
+                    should_print=should_print,
+                )
+                status = await self._wait_for_app_with_polling(
+                    api=api,
+                    namespace=namespace,
+                    pod_name=pod_name,
+                    app_id=app_id,
+                    poll_interval=poll_interval,
                     should_print=should_print,
                 )
-                await asyncio.sleep(poll_interval)
+            if status is None:
+                self.log(msg=f"Pod {pod_name} was deleted", level=logging.INFO, should_print=should_print)
+                return
             self.log(
                 msg=f"Pod {pod_name} finished with status {status.value}",
                 level=logging.INFO,
                 should_print=should_print,
             )
 
+    async def _wait_for_app_with_watch(
+        self,
+        *,
+        api: k8s_async.CoreV1Api,
+        namespace: str,
+        pod_name: str | None = None,
+        app_id: str | None = None,
+    ) -> SparkAppStatus | None:
+        """Wait for a Spark app to finish by watching the driver pod.
+
+        Args:
+            api (k8s_async.CoreV1Api): Kubernetes client.
+            namespace (str): Namespace.
+            pod_name (str): Pod name.
+            app_id (str): App ID.
+
+        Returns:
+            SparkAppStatus | None: Termination status, or None if the pod was deleted.
+        """
+        if pod_name is None and app_id is None:
+            raise ValueError("Either pod_name or app_id must be specified")
+        termination_statuses = {SparkAppStatus.Succeeded, SparkAppStatus.Failed, SparkAppStatus.Unknown}
+        selectors = (
+            {"field_selector": f"metadata.name={pod_name}"}
+            if pod_name is not None
+            else {"label_selector": f"spark-app-id={app_id}"}
+        )
+        while True:
+            # list before watching: a watch on a missing or already-terminated pod
+            # produces no event, so it would wait forever
+            pod_list = await api.list_namespaced_pod(namespace=namespace, **selectors)
+            if not pod_list.items:
+                return None
+            status = get_app_status(pod_list.items[0])
+            if status in termination_statuses:
+                return status
+            watcher = watch.Watch()
+            async for event in watcher.stream(
+                api.list_namespaced_pod,
+                namespace=namespace,
+                resource_version=pod_list.metadata.resource_version,
+                timeout_seconds=3600,
+                **selectors,
+            ):
+                if event["type"] == "DELETED":
+                    await watcher.close()
+                    return None
+                status = get_app_status(event["object"])
+                if status in termination_statuses:
+                    await watcher.close()
+                    return status
+
+    async def _wait_for_app_with_polling(
+        self,
+        *,
+        api: k8s_async.CoreV1Api,
+        namespace: str,
+        pod_name: str | None = None,
+        app_id: str | None = None,
+        poll_interval: float = 10,
+        should_print: bool = False,
+    ) -> SparkAppStatus | None:
+        """Wait for a Spark app to finish by polling the driver pod status.
+
+        Args:
+            api (k8s_async.CoreV1Api): Kubernetes client.
+            namespace (str): Namespace.
+            pod_name (str): Pod name.
+            app_id (str): App ID.
+            poll_interval (float, optional): Poll interval in seconds. Defaults to 10.
+            should_print (bool, optional): Whether to print logs instead of logging them.
+
+        Returns:
+            SparkAppStatus | None: Termination status, or None if the pod was deleted.
+        """
+        termination_statuses = {SparkAppStatus.Succeeded, SparkAppStatus.Failed, SparkAppStatus.Unknown}
+        while True:
+            try:
+                status = await self.app_status(
+                    namespace=namespace, pod_name=pod_name, app_id=app_id, client=api
+                )
+                if status in termination_statuses:
+                    return status
+            except ApiException as e:
+                if e.status == 404:
+                    return None
+            self.log(
+                msg=f"Pod {pod_name} status is {status}, sleep {poll_interval}s",
+                level=logging.INFO,
+                should_print=should_print,
+            )
+            await asyncio.sleep(poll_interval)
+
     async def logs_streamer(
         self,
         *,
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-import json
 from os import getenv
 
-from kubernetes import client as k8s
+try:
+    # use orjson to parse the JSON env vars when it is available, it's a lot faster
+    import orjson as json
+except ImportError:
+    import json
 
 
 class Configuration:
@@ -20,6 +23,7 @@ class Configuration:
     SPARK_ON_K8S_APP_WAITER = getenv("SPARK_ON_K8S_APP_WAITER", "no_wait")
     SPARK_ON_K8S_IMAGE_PULL_POLICY = getenv("SPARK_ON_K8S_IMAGE_PULL_POLICY", "IfNotPresent")
     SPARK_ON_K8S_UI_REVERSE_PROXY = getenv("SPARK_ON_K8S_UI_REVERSE_PROXY", "false").lower() == "true"
+    SPARK_ON_K8S_USE_RE2 = getenv("SPARK_ON_K8S_USE_RE2", "true").lower() == "true"
     SPARK_ON_K8S_DRIVER_CPU = int(getenv("SPARK_ON_K8S_DRIVER_CPU", 1))
     SPARK_ON_K8S_DRIVER_MEMORY = int(getenv("SPARK_ON_K8S_DRIVER_MEMORY", 1024))
     SPARK_ON_K8S_DRIVER_MEMORY_OVERHEAD = int(getenv("SPARK_ON_K8S_DRIVER_MEMORY_OVERHEAD", 512))
@@ -52,12 +56,16 @@ class Configuration:
     # K8S client configuration
     SPARK_ON_K8S_CONFIG_FILE = getenv("SPARK_ON_K8S_CONFIG_FILE", None)
     SPARK_ON_K8S_CONTEXT = getenv("SPARK_ON_K8S_CONTEXT", None)
-    SPARK_ON_K8S_CLIENT_CONFIG = (
-        k8s.Configuration(json.loads(getenv("SPARK_ON_K8S_CLIENT_CONFIG")))
-        if getenv("SPARK_ON_K8S_CLIENT_CONFIG", None)
-        else None
-    )
+    # the kubernetes clients are imported lazily, so the CLI doesn't pay their import
+    # cost (e.g. for --help) when the client configuration env vars are not set
+    if getenv("SPARK_ON_K8S_CLIENT_CONFIG", None):
+        from kubernetes import client as k8s
+
+        SPARK_ON_K8S_CLIENT_CONFIG = k8s.Configuration(json.loads(getenv("SPARK_ON_K8S_CLIENT_CONFIG")))
+    else:
+        SPARK_ON_K8S_CLIENT_CONFIG = None
     SPARK_ON_K8S_IN_CLUSTER = bool(getenv("SPARK_ON_K8S_IN_CLUSTER", False))
+    SPARK_ON_K8S_CONNECTION_POOL_MAXSIZE = int(getenv("SPARK_ON_K8S_CONNECTION_POOL_MAXSIZE", "100"))
     SPARK_ON_K8S_SPARK_DRIVER_NODE_SELECTOR = json.loads(
         getenv("SPARK_ON_K8S_SPARK_DRIVER_NODE_SELECTOR", "{}")
     )
@@ -71,13 +79,14 @@ class Configuration:
         getenv("SPARK_ON_K8S_SPARK_EXECUTOR_ANNOTATIONS", "{}")
     )
     SPARK_ON_K8S_EXECUTOR_POD_TEMPLATE_PATH = getenv("SPARK_ON_K8S_EXECUTOR_POD_TEMPLATE_PATH", None)
-    try:
-        from kubernetes_asyncio import client as async_k8s
+    if getenv("SPARK_ON_K8S_ASYNC_CLIENT_CONFIG", None):
+        try:
+            from kubernetes_asyncio import client as async_k8s
 
-        SPARK_ON_K8S_ASYNC_CLIENT_CONFIG = (
-            async_k8s.Configuration(json.loads(getenv("SPARK_ON_K8S_ASYNC_CLIENT_CONFIG")))
-            if getenv("SPARK_ON_K8S_ASYNC_CLIENT_CONFIG", None)
-            else None
-        )
-    except ImportError:
+            SPARK_ON_K8S_ASYNC_CLIENT_CONFIG = async_k8s.Configuration(
+                json.loads(getenv("SPARK_ON_K8S_ASYNC_CLIENT_CONFIG"))
+            )
+        except ImportError:
+            SPARK_ON_K8S_ASYNC_CLIENT_CONFIG = None
+    else:
         SPARK_ON_K8S_ASYNC_CLIENT_CONFIG = None
@@ -18,15 +18,15 @@ class SparkAppStatus(str, Enum):
     Unknown = "Unknown"
 
 
+_PHASE_TO_STATUS: dict[str, SparkAppStatus] = {
+    "Pending": SparkAppStatus.Pending,
+    "Running": SparkAppStatus.Running,
+    "Succeeded": SparkAppStatus.Succeeded,
+    "Failed": SparkAppStatus.Failed,
+    "Unknown": SparkAppStatus.Unknown,
+}
+
+
 def get_app_status(pod: k8s.V1Pod | k8s_async.V1Pod) -> SparkAppStatus:
     """Get app status."""
-    if pod.status.phase == "Pending":
-        return SparkAppStatus.Pending
-    elif pod.status.phase == "Running":
-        return SparkAppStatus.Running
-    elif pod.status.phase == "Succeeded":
-        return SparkAppStatus.Succeeded
-    elif pod.status.phase == "Failed":
-        return SparkAppStatus.Failed
-    else:
-        return SparkAppStatus.Unknown
+    return _PHASE_TO_STATUS.get(getattr(pod.status, "phase", None), SparkAppStatus.Unknown)
@@ -62,4 +62,5 @@ def test_list(mock_uvicorn_run, host, port, workers, log_level, limit_concurrenc
         workers=expected_workers,
         log_level=expected_log_level,
         limit_concurrency=expected_limit_concurrency,
+        loop=mock.ANY,
     )
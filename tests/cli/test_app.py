@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from unittest import mock
 
 import pytest
@@ -9,6 +10,16 @@ TEST_NAMESPACE = "test-namespace"
 TEST_APP_ID = "test-id"
 
 
+@pytest.fixture(autouse=True)
+def reset_app_manager():
+    """Reset the shared app manager, so each test gets an instance of its own mock."""
+    import spark_on_k8s.cli.app
+
+    spark_on_k8s.cli.app._app_manager = None
+    yield
+    spark_on_k8s.cli.app._app_manager = None
+
+
 @mock.patch("spark_on_k8s.utils.app_manager.SparkAppManager")
 def test_status(mock_spark_app_manager):
     from spark_on_k8s.cli.app import status
@@ -80,4 +91,39 @@ def test_wait(mock_spark_app_manager):
     assert result.output == f"App {TEST_APP_ID} has terminated with status Succeeded\n"
 
 
+@mock.patch("spark_on_k8s.client.SparkOnK8S")
+def test_submit_batch(mock_spark_on_k8s, tmp_path):
+    from spark_on_k8s.cli.app import submit_batch
+
+    mock_spark_on_k8s().submit_app_async = mock.AsyncMock(
+        side_effect=["pyspark-job-20240114121231-driver", RuntimeError("invalid app path")]
+    )
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(
+        json.dumps(
+            [
+                {"image": "pyspark-job", "app_path": "local:///opt/spark/job.py", "app_name": "job-1"},
+                {"image": "pyspark-job", "app_path": "local:///opt/spark/job.py", "app_name": "job-2"},
+            ]
+        )
+    )
+    result = CliRunner().invoke(submit_batch, [str(manifest)])
+    assert result.exit_code == 1
+    assert "Submitted app pyspark-job-20240114121231-driver" in result.output
+    assert "Failed to submit app job-2: invalid app path" in result.output
+    assert "1 of 2 submissions failed" in result.output
+
+
+@mock.patch("spark_on_k8s.client.SparkOnK8S")
+def test_submit_batch_rejects_should_print(mock_spark_on_k8s, tmp_path):
+    from spark_on_k8s.cli.app import submit_batch
+
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps([{"image": "pyspark-job", "should_print": False}]))
+    result = CliRunner().invoke(submit_batch, [str(manifest)])
+    assert result.exit_code == 2
+    assert "must not set should_print" in result.output
+    mock_spark_on_k8s().submit_app_async.assert_not_called()
+
+
 # TODO: add some tests for submit command
@@ -248,6 +248,50 @@ class TestSparkOnK8s:
             "100000",
         ]
 
+    @mock.patch("spark_on_k8s.k8s.async_client.KubernetesAsyncClientManager.create_client")
+    @mock.patch(
+        "kubernetes_asyncio.client.api.core_v1_api.CoreV1Api.create_namespaced_pod",
+        new_callable=mock.AsyncMock,
+    )
+    @mock.patch(
+        "kubernetes_asyncio.client.api.core_v1_api.CoreV1Api.create_namespaced_service",
+        new_callable=mock.AsyncMock,
+    )
+    @freeze_time(FAKE_TIME)
+    def test_submit_app_async(
+        self, mock_create_namespaced_service, mock_create_namespaced_pod, mock_create_client
+    ):
+        """Test the method submit_app_async"""
+        import asyncio
+
+        mock_create_client.return_value = mock.AsyncMock()
+
+        spark_client = SparkOnK8S()
+        asyncio.run(
+            spark_client.submit_app_async(
+                image="pyspark-job",
+                app_path="local:///opt/spark/work-dir/job.py",
+                namespace="spark",
+                service_account="spark",
+                app_name="pyspark-job-example",
+                app_arguments=["100000"],
+                app_waiter="no_wait",
+                image_pull_policy="Never",
+            )
+        )
+
+        expected_app_name = "pyspark-job-example"
+        expected_app_id = f"{expected_app_name}-20240114121231"
+
+        created_pod = mock_create_namespaced_pod.call_args[1]["body"]
+        assert created_pod.metadata.name == f"{expected_app_id}-driver"
+        assert created_pod.metadata.labels["spark-app-name"] == expected_app_name
+        assert created_pod.metadata.labels["spark-app-id"] == expected_app_id
+        assert created_pod.metadata.labels["spark-role"] == "driver"
+        assert created_pod.spec.containers[0].image == "pyspark-job"
+        created_service = mock_create_namespaced_service.call_args[1]["body"]
+        assert created_service.metadata.name == expected_app_id
+
     @mock.patch("spark_on_k8s.k8s.sync_client.KubernetesClientManager.create_client")
     @mock.patch("spark_on_k8s.utils.app_manager.SparkAppManager.stream_logs")
     @mock.patch("kubernetes.client.api.core_v1_api.CoreV1Api.create_namespaced_pod")